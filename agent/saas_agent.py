@@ -4,26 +4,73 @@ Conversational AI agent that scans and analyzes SaaS opportunities from Hacker N
 """
 
 import os
-import json
-from typing import List, Dict, Any, Optional
+import re
+import heapq
+import asyncio
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncGenerator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Security, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-import httpx
-from anyio import to_thread
+import aiohttp
+import orjson
+from cachetools import TTLCache
 
 # Load environment variables
 load_dotenv()
 
+# Scanner components; a broken scraper install disables scanning instead of crashing startup
+scanner_import_error: Optional[Exception] = None
+try:
+    from scrapers.hn_scraper import scan_hacker_news, http_client as hn_client
+    from scrapers.matcher import INDUSTRY_BIT
+    from config import INDUSTRIES, PAIN_SIGNALS
+except Exception as e:
+    print(f"Scanner import failed ({e}), scanning disabled")
+    scan_hacker_news = None
+    hn_client = None
+    INDUSTRY_BIT = {}
+    INDUSTRIES = {}
+    PAIN_SIGNALS = []
+    scanner_import_error = e
+
+# Shared aiohttp session for OpenAI calls, opened for the lifetime of the app
+llm_session: Optional[aiohttp.ClientSession] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the pooled LLM session on startup and close it on shutdown."""
+    global llm_session
+    llm_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=50),
+        timeout=aiohttp.ClientTimeout(total=60)
+    )
+    try:
+        yield
+    finally:
+        await llm_session.close()
+        if hn_client:
+            await hn_client.aclose()
+        # Flush pending message writes without blocking the event loop
+        await asyncio.to_thread(supabase_executor.shutdown, wait=True)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SaaS Opportunity Bot Agent",
     description="AI agent that scans Hacker News for SaaS opportunities in high-value industries",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 security = HTTPBearer()
 
@@ -35,18 +82,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Scanner components imported lazily in functions to avoid startup crashes
-# from scrapers.hn_scraper import scan_hacker_news
-# from config import INDUSTRIES, PAIN_SIGNALS
-
-
-def get_scanner_components():
-    """Lazy load scanner components to avoid import failures at startup."""
-    from scrapers.hn_scraper import scan_hacker_news
-    from config import INDUSTRIES, PAIN_SIGNALS
-    return scan_hacker_news, INDUSTRIES, PAIN_SIGNALS
-
-
 # Request/Response Models (ottomator standard)
 class AgentRequest(BaseModel):
     query: str
@@ -75,10 +110,11 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Security(security))
     return True
 
 
-async def call_llm(system_prompt: str, user_message: str, context: str = "") -> str:
-    """Call OpenAI API to generate response."""
+async def stream_llm(system_prompt: str, user_message: str, context: str = "") -> AsyncGenerator[str, None]:
+    """Call OpenAI API with streaming and yield content tokens as they arrive."""
     if not OPENAI_API_KEY:
-        return "Error: OPENAI_API_KEY not configured. Please set your API key."
+        yield "Error: OPENAI_API_KEY not configured. Please set your API key."
+        return
     
     messages = [
         {"role": "system", "content": system_prompt},
@@ -87,74 +123,145 @@ async def call_llm(system_prompt: str, user_message: str, context: str = "") ->
         messages.append({"role": "assistant", "content": f"Context from previous analysis:\n{context}"})
     messages.append({"role": "user", "content": user_message})
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": LLM_MODEL,
-                "messages": messages,
-                "temperature": 0.7,
-                "max_tokens": 2000
-            }
-        )
-        
-        if response.status_code != 200:
-            return f"LLM Error: {response.text}"
+    async with llm_session.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        data=orjson.dumps({
+            "model": LLM_MODEL,
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": 2000,
+            "stream": True
+        })
+    ) as response:
+        if response.status != 200:
+            yield f"LLM Error: {await response.text()}"
+            return
         
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data: "):
+                continue
+            payload = line[len(b"data: "):]
+            if payload == b"[DONE]":
+                break
+            choices = orjson.loads(payload).get("choices") or [{}]
+            token = choices[0].get("delta", {}).get("content")
+            if token:
+                yield token
+
+
+# Engagement tiers: points for exceeding each threshold (bisect_left keeps the strict ">")
+SCORE_THRESHOLDS = [10, 50, 100]
+SCORE_POINTS = [0, 5, 10, 20]
+COMMENT_THRESHOLDS = [5, 20, 50]
+COMMENT_POINTS = [0, 5, 10, 15]
 
 
 def score_opportunity(opp: dict) -> int:
     """Score an opportunity based on various factors."""
-    score = 0
-    score += len(opp.get("pain_signals", [])) * 10
-    score += len(opp.get("industries", [])) * 5
+    return (
+        len(opp.get("pain_signals", [])) * 10
+        + len(opp.get("industries", [])) * 5
+        + SCORE_POINTS[bisect_left(SCORE_THRESHOLDS, opp.get("score", 0))]
+        + COMMENT_POINTS[bisect_left(COMMENT_THRESHOLDS, opp.get("num_comments", 0))]
+    )
+
+
+# Scan results shared across sessions, keyed by (industry_filter, limit). Each
+# entry is (opportunities, industry_counts, hits), where hits is every match
+# in the order the scan found it, so streams can be replayed identically
+SCAN_CACHE_TTL = 60  # seconds; HN listings barely change minute to minute
+scan_cache: TTLCache = TTLCache(maxsize=32, ttl=SCAN_CACHE_TTL)
+scan_locks: Dict[tuple, asyncio.Lock] = {}
+
+# Strong references to scans that outlive the request that started them
+background_tasks: set = set()
+
+
+async def run_scan(
+    industry_filter: Optional[str] = None,
+    limit: int = 20,
+    found: Optional[asyncio.Queue] = None
+) -> Tuple[List[Dict], Counter]:
+    """Return cached (opportunities, industry_counts), running at most one scan per key at a time.
     
-    post_score = opp.get("score", 0)
-    if post_score > 100:
-        score += 20
-    elif post_score > 50:
-        score += 10
-    elif post_score > 10:
-        score += 5
+    Every match the scan finds is put on `found`: live if this call runs the
+    scan, replayed in the same order if the result comes from the cache or
+    another caller's scan.
+    """
+    key = (industry_filter, limit)
+    entry = scan_cache.get(key)
+    if entry is None:
+        # Concurrent requests for the same key wait for the first scan instead of repeating it
+        async with scan_locks.setdefault(key, asyncio.Lock()):
+            entry = scan_cache.get(key)
+            if entry is None:
+                entry = scan_cache[key] = await scan_opportunities(industry_filter, limit, found)
+                return entry[:2]
     
-    num_comments = opp.get("num_comments", 0)
-    if num_comments > 50:
-        score += 15
-    elif num_comments > 20:
-        score += 10
-    elif num_comments > 5:
-        score += 5
+    opportunities, industry_counts, hits = entry
+    if found is not None:
+        for opp in hits:
+            found.put_nowait(opp)
+    return opportunities, industry_counts
+
+
+async def scan_opportunities(
+    industry_filter: Optional[str] = None,
+    limit: int = 20,
+    found: Optional[asyncio.Queue] = None
+) -> Tuple[List[Dict], Counter, List[Dict]]:
+    """Run the HN scanner and return the top opportunities by priority score.
     
-    return score
-
-
-def run_scan(industry_filter: Optional[str] = None, limit: int = 20) -> List[Dict]:
-    """Run the HN scanner and return opportunities."""
-    scan_hacker_news, _, _ = get_scanner_components()
-    opportunities = []
+    Also returns how many of those opportunities mention each industry,
+    tallied as entries enter and leave the top-K heap, and every match in
+    discovery order (each is also put on `found` as it is discovered).
+    """
+    if scan_hacker_news is None:
+        raise RuntimeError(f"Scanner unavailable: {scanner_import_error}")
     
-    for opp in scan_hacker_news():
-        opp["priority_score"] = score_opportunity(opp)
-        
-        # Apply industry filter if specified
-        if industry_filter:
-            if industry_filter.lower() not in [i.lower() for i in opp.get("industries", [])]:
+    # Min-heap of the best `limit` so far; ties keep the earlier find
+    top = []
+    arrival = count()
+    industry_counts = Counter()
+    industry_bit = INDUSTRY_BIT.get(industry_filter, 0)
+    hits = []
+    
+    async with aclosing(scan_hacker_news()) as scan:
+        async for opp in scan:
+            opp["priority_score"] = score_opportunity(opp)
+            
+            # Apply industry filter if specified
+            if industry_filter and not opp["industry_mask"] & industry_bit:
                 continue
-        
-        opportunities.append(opp)
-        
-        if len(opportunities) >= limit * 3:  # Get extra to filter/sort
-            break
+            
+            hits.append(opp)
+            if found is not None:
+                found.put_nowait(opp)
+            
+            entry = (opp["priority_score"], -next(arrival), opp)
+            industry_counts.update(opp["industries"])
+            if len(top) < limit:
+                heapq.heappush(top, entry)
+            else:
+                _, _, evicted = heapq.heappushpop(top, entry)
+                industry_counts.subtract(evicted["industries"])
     
-    # Sort by priority score
-    opportunities.sort(key=lambda x: x.get("priority_score", 0), reverse=True)
-    return opportunities[:limit]
+    return [opp for _, _, opp in sorted(top, reverse=True)], +industry_counts, hits
+
+
+OPPORTUNITY_TEMPLATE = (
+    "**#{rank} [Score: {score}]**\n"
+    "📌 {title}\n"
+    "{text_line}"
+    "🔍 Signals: {signals}\n"
+    "{industries_line}"
+    "🔗 {url}\n"
+)
 
 
 def format_opportunities(opportunities: List[Dict], limit: int = 10) -> str:
@@ -162,85 +269,98 @@ def format_opportunities(opportunities: List[Dict], limit: int = 10) -> str:
     if not opportunities:
         return "No opportunities found matching your criteria."
     
-    lines = [f"Found {len(opportunities)} opportunities:\n"]
-    
-    for i, opp in enumerate(opportunities[:limit], 1):
-        lines.append(f"**#{i} [Score: {opp['priority_score']}]**")
-        lines.append(f"📌 {opp['title']}")
-        if opp.get('text'):
-            lines.append(f"   {opp['text'][:200]}...")
-        lines.append(f"🔍 Signals: {', '.join(opp['pain_signals'][:3])}")
-        if opp['industries']:
-            lines.append(f"🏢 Industries: {', '.join(opp['industries'])}")
-        lines.append(f"🔗 {opp['url']}")
-        lines.append("")
-    
-    return "\n".join(lines)
+    blocks = (
+        OPPORTUNITY_TEMPLATE.format(
+            rank=i,
+            score=opp["priority_score"],
+            title=opp["title"],
+            text_line=f"   {opp['text'][:200]}...\n" if opp["text"] else "",
+            signals=", ".join(opp["pain_signals"][:3]),
+            industries_line=f"🏢 Industries: {', '.join(opp['industries'])}\n" if opp["industries"] else "",
+            url=opp["url"],
+        )
+        for i, opp in enumerate(opportunities[:limit], 1)
+    )
+    return "\n".join([f"Found {len(opportunities)} opportunities:\n", *blocks])
 
 
-def get_industry_summary(opportunities: List[Dict]) -> str:
-    """Get industry breakdown."""
-    industry_counts = {}
-    for opp in opportunities:
-        for ind in opp.get("industries", []):
-            industry_counts[ind] = industry_counts.get(ind, 0) + 1
-    
+def get_industry_summary(industry_counts: Counter) -> str:
+    """Get industry breakdown from the counts tallied during the scan."""
     if not industry_counts:
         return "No industry-specific opportunities found."
     
-    lines = ["**Industry Breakdown:**"]
-    for ind, count in sorted(industry_counts.items(), key=lambda x: x[1], reverse=True):
-        lines.append(f"  • {ind}: {count} opportunities")
-    return "\n".join(lines)
+    ranked = industry_counts.most_common()
+    return "\n".join(["**Industry Breakdown:**", *(f"  • {ind}: {count} opportunities" for ind, count in ranked)])
+
+
+# Phrases that select each action, highest priority first
+INTENT_PHRASES = {
+    "analyze": ["analyze", "analysis", "insights", "summarize", "summary"],
+    "explain": ["explain", "what is", "how does", "help"],
+    "list_industries": ["list industries", "what industries", "available industries"],
+    "list_signals": ["list signals", "what signals", "pain signals"],
+}
+INDUSTRY_ALIASES = {
+    alias: industry
+    for industry in INDUSTRIES
+    for alias in (industry.lower().replace("_", " "), industry.lower())
+}
+
+
+def build_intent_regex() -> re.Pattern:
+    """Compile every intent phrase, industry alias and limit into one alternation."""
+    def alternation(phrases):
+        return "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    
+    groups = [f"(?P<{action}>{alternation(phrases)})" for action, phrases in INTENT_PHRASES.items()]
+    if INDUSTRY_ALIASES:
+        groups.append(f"(?P<industry>{alternation(INDUSTRY_ALIASES)})")
+    groups.append(r"(?<!\S)(?P<limit>\d+)(?!\S)")
+    return re.compile("|".join(groups))  # Matched against the lowercased query
+
+
+INTENT_RE = build_intent_regex()
 
 
 def parse_user_intent(query: str) -> Dict[str, Any]:
     """Parse user query to determine intent."""
-    _, INDUSTRIES, _ = get_scanner_components()
-    query_lower = query.lower()
-    
     intent = {
         "action": "scan",  # scan, analyze, explain, list
         "industry_filter": None,
         "limit": 10
     }
     
-    # Check for specific actions
-    if any(word in query_lower for word in ["analyze", "analysis", "insights", "summarize", "summary"]):
-        intent["action"] = "analyze"
-    elif any(word in query_lower for word in ["explain", "what is", "how does", "help"]):
-        intent["action"] = "explain"
-    elif any(word in query_lower for word in ["list industries", "what industries", "available industries"]):
-        intent["action"] = "list_industries"
-    elif any(word in query_lower for word in ["list signals", "what signals", "pain signals"]):
-        intent["action"] = "list_signals"
+    # One pass over the query collects every action, industry and number mentioned;
+    # the first industry and number win
+    actions = set()
+    limit = None
+    for match in INTENT_RE.finditer(query.lower()):
+        group = match.lastgroup
+        if group == "industry":
+            intent["industry_filter"] = intent["industry_filter"] or INDUSTRY_ALIASES[match.group()]
+        elif group == "limit":
+            limit = int(match.group()) if limit is None else limit
+        else:
+            actions.add(group)
     
-    # Check for industry filter
-    for industry in INDUSTRIES.keys():
-        if industry.lower().replace("_", " ") in query_lower or industry.lower() in query_lower:
-            intent["industry_filter"] = industry
-            break
+    if limit is not None:
+        intent["limit"] = min(limit, 50)
     
-    # Check for limit
-    for word in query_lower.split():
-        if word.isdigit():
-            intent["limit"] = min(int(word), 50)
+    for action in INTENT_PHRASES:
+        if action in actions:
+            intent["action"] = action
             break
     
     return intent
 
 
-# In-memory cache for scan results (per session)
-scan_cache: Dict[str, List[Dict]] = {}
-
-
-async def process_query(query: str, session_id: str) -> str:
-    """Process user query and return response."""
+async def stream_query(query: str, session_id: str) -> AsyncGenerator[str, None]:
+    """Process user query and yield the response in chunks as it is produced."""
     intent = parse_user_intent(query)
     
     # Handle different intents
     if intent["action"] == "explain":
-        return """**SaaS Opportunity Bot** 🚀
+        yield """**SaaS Opportunity Bot** 🚀
 
 I scan Hacker News for pain points that indicate SaaS opportunities in high-value industries.
 
@@ -255,45 +375,41 @@ I scan Hacker News for pain points that indicate SaaS opportunities in high-valu
 • "Show me healthcare pain points" - Industry-specific scan
 • "List industries" - See all tracked industries
 • "List signals" - See pain point signals I detect"""
+        return
     
     if intent["action"] == "list_industries":
-        _, INDUSTRIES, _ = get_scanner_components()
         lines = ["**Tracked Industries:**"]
         for industry, keywords in INDUSTRIES.items():
             lines.append(f"• **{industry.replace('_', ' ').title()}**: {', '.join(keywords[:5])}...")
-        return "\n".join(lines)
+        yield "\n".join(lines)
+        return
     
     if intent["action"] == "list_signals":
-        _, _, PAIN_SIGNALS = get_scanner_components()
         lines = ["**Pain Point Signals I Detect:**"]
         for i, signal in enumerate(PAIN_SIGNALS, 1):
             lines.append(f"{i}. \"{signal}\"")
-        return "\n".join(lines)
+        yield "\n".join(lines)
+        return
     
-    # Run scan (offload to thread to avoid blocking event loop)
+    # Run scan (the scraper is async, so it runs on the event loop directly)
     print(f"Running scan with filter: {intent['industry_filter']}, limit: {intent['limit']}")
-    opportunities = await to_thread.run_sync(
-        run_scan,
-        intent["industry_filter"],
-        intent["limit"]
-    )
-    
-    # Cache results for this session
-    scan_cache[session_id] = opportunities
+    opportunities, industry_counts = await run_scan(intent["industry_filter"], intent["limit"])
     
     if intent["action"] == "analyze":
         # Use LLM to analyze opportunities
         if not opportunities:
-            return "No opportunities found to analyze. Try running a scan first."
+            yield "No opportunities found to analyze. Try running a scan first."
+            return
         
-        opp_summary = json.dumps([{
+        # Compact JSON: the LLM doesn't need pretty-printing, and indentation costs prompt tokens
+        opp_summary = orjson.dumps([{
             "title": o["title"],
             "text": o.get("text", "")[:300],
             "pain_signals": o["pain_signals"],
             "industries": o["industries"],
             "score": o["priority_score"],
             "url": o["url"]
-        } for o in opportunities[:15]], indent=2)
+        } for o in opportunities[:15]]).decode()
         
         system_prompt = """You are a SaaS opportunity analyst. Analyze the following pain points found on Hacker News and provide:
 1. Top 3-5 most promising SaaS ideas based on these pain points
@@ -303,21 +419,23 @@ I scan Hacker News for pain points that indicate SaaS opportunities in high-valu
 
 Be specific, actionable, and entrepreneurial. Format with markdown."""
         
-        analysis = await call_llm(system_prompt, f"Analyze these opportunities:\n{opp_summary}")
-        
-        return f"""**AI Analysis of {len(opportunities)} Opportunities**
-
-{analysis}
-
----
-*Based on live scan of Hacker News*"""
+        yield f"**AI Analysis of {len(opportunities)} Opportunities**\n\n"
+        async for token in stream_llm(system_prompt, f"Analyze these opportunities:\n{opp_summary}"):
+            yield token
+        yield "\n\n---\n*Based on live scan of Hacker News*"
+        return
     
     # Default: show scan results
     result = format_opportunities(opportunities, intent["limit"])
-    result += "\n\n" + get_industry_summary(opportunities)
+    result += "\n\n" + get_industry_summary(industry_counts)
     result += "\n\n💡 *Say \"analyze\" for AI insights on these opportunities*"
     
-    return result
+    yield result
+
+
+async def process_query(query: str, session_id: str) -> str:
+    """Process user query and return the full response."""
+    return "".join([chunk async for chunk in stream_query(query, session_id)])
 
 
 # Supabase integration (optional - for conversation history)
@@ -337,8 +455,24 @@ if SUPABASE_URL and SUPABASE_SERVICE_KEY:
         supabase_client = None
 
 
+# The sync Supabase client blocks on each DB round-trip, so inserts run on one
+# worker thread: off the event loop, and still in the order they were issued
+supabase_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="supabase")
+
+
+def insert_message(session_id: str, message_obj: Dict):
+    """Insert a message row (blocking)."""
+    try:
+        supabase_client.table("messages").insert({
+            "session_id": session_id,
+            "message": message_obj
+        }).execute()
+    except Exception as e:
+        print(f"Failed to store message: {e}")
+
+
 async def store_message(session_id: str, message_type: str, content: str, data: Optional[Dict] = None):
-    """Store a message in Supabase (if configured)."""
+    """Store a message in Supabase (if configured) without waiting for the write."""
     if not supabase_client:
         return
     
@@ -346,13 +480,7 @@ async def store_message(session_id: str, message_type: str, content: str, data:
     if data:
         message_obj["data"] = data
     
-    try:
-        supabase_client.table("messages").insert({
-            "session_id": session_id,
-            "message": message_obj
-        }).execute()
-    except Exception as e:
-        print(f"Failed to store message: {e}")
+    asyncio.get_running_loop().run_in_executor(supabase_executor, insert_message, session_id, message_obj)
 
 
 @app.post("/api/saas-opportunity-agent", response_model=AgentResponse)
@@ -393,6 +521,88 @@ async def saas_opportunity_agent(
         return AgentResponse(success=False)
 
 
+def sse_event(payload: Any) -> bytes:
+    """Encode a payload as a server-sent event frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+async def stream_scan_hits(industry_filter: Optional[str], limit: int) -> AsyncGenerator[Dict, None]:
+    """Yield opportunities as the scan discovers them.
+    
+    The scan runs as a background task, so it still completes and fills
+    scan_cache if the client disconnects mid-stream.
+    """
+    found: asyncio.Queue = asyncio.Queue()
+    
+    async def scan():
+        try:
+            return await run_scan(industry_filter, limit, found)
+        finally:
+            found.put_nowait(None)
+    
+    task = asyncio.create_task(scan())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    
+    while (opp := await found.get()) is not None:
+        yield opp
+    await task  # Surface scan errors to the caller
+
+
+async def sse_response_stream(request: AgentRequest) -> AsyncGenerator[bytes, None]:
+    """Yield the agent response as SSE events, storing it once complete.
+    
+    Scans first emit an `opportunity` event per hit, then the formatted
+    response follows as `token` events.
+    """
+    chunks = []
+    try:
+        intent = parse_user_intent(request.query)
+        if intent["action"] in ("scan", "analyze"):
+            async for opp in stream_scan_hits(intent["industry_filter"], intent["limit"]):
+                yield sse_event({"opportunity": opp})
+        
+        async for chunk in stream_query(request.query, request.session_id):
+            chunks.append(chunk)
+            yield sse_event({"token": chunk})
+    except Exception as e:
+        print(f"Error streaming request: {e}")
+        await store_message(
+            session_id=request.session_id,
+            message_type="ai",
+            content=f"I encountered an error: {str(e)}",
+            data={"error": str(e), "request_id": request.request_id}
+        )
+        yield sse_event({"error": str(e)})
+        return
+    
+    await store_message(
+        session_id=request.session_id,
+        message_type="ai",
+        content="".join(chunks),
+        data={"request_id": request.request_id}
+    )
+    yield b"data: [DONE]\n\n"
+
+
+@app.post("/api/saas-opportunity-agent/stream")
+async def saas_opportunity_agent_stream(
+    request: AgentRequest,
+    authenticated: bool = Depends(verify_token)
+):
+    """Streaming variant of the agent endpoint (server-sent events)."""
+    await store_message(
+        session_id=request.session_id,
+        message_type="human",
+        content=request.query
+    )
+    return StreamingResponse(
+        sse_response_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -406,7 +616,8 @@ async def root():
         "name": "SaaS Opportunity Bot",
         "version": "1.0.0",
         "description": "Scans Hacker News for SaaS opportunities in high-value industries",
-        "endpoint": "/api/saas-opportunity-agent"
+        "endpoint": "/api/saas-opportunity-agent",
+        "stream_endpoint": "/api/saas-opportunity-agent/stream"
     }
 
 
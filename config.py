@@ -60,9 +60,23 @@ SUBREDDITS = [
     "agency",
 ]
 
+# Reddit settings
+REDDIT_MAX_CONCURRENCY = 8  # Parallel Reddit requests in flight
+REDDIT_REQUESTS_PER_MINUTE = 55  # Stays under Reddit's 60/min unauthenticated limit
+REDDIT_MIN_COMMENTS = 5  # Posts need more comments than this to have their thread read
+REDDIT_MIN_POST_SCORE = 5  # ...and at least this score
+REDDIT_MAX_COMMENT_FETCHES_PER_SUB = 10  # Threads read per subreddit, hottest first
+REDDIT_MAX_COMMENT_HITS = 10  # Stop reading a thread once this many comments match
+REDDIT_CACHE_DIR = "/tmp/reddit_cache"  # On-disk cache of listings and matched comments
+REDDIT_CACHE_TTL = 300  # Seconds to reuse a cached listing or thread
+
 # Hacker News settings
 HN_STORIES_TO_CHECK = 100  # Top/new stories to scan
 HN_MIN_COMMENTS = 5  # Minimum comments to consider
+HN_MAX_CONCURRENCY = 32  # Parallel HN API requests in flight
+HN_CACHE_DIR = "/tmp/hn_cache"  # On-disk cache of fetched items
+HN_STORY_CACHE_TTL = 300  # Seconds to reuse a fresh story (score/comments still changing)
+HN_COMMENT_CACHE_TTL = 86400  # Seconds to reuse a comment or day-old story
 
 # Output settings
 OUTPUT_DIR = "results"
@@ -3,9 +3,11 @@ SaaS Opportunity Bot
 Scans Reddit and Hacker News for pain points in high-value industries.
 """
 
+import asyncio
 import csv
 import json
 import os
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
 
@@ -13,35 +15,25 @@ from scrapers.hn_scraper import scan_hacker_news
 from config import OUTPUT_DIR
 
 
+# Engagement tiers: points for exceeding each threshold (bisect_left keeps the strict ">")
+SCORE_THRESHOLDS = [10, 50, 100]
+SCORE_POINTS = [0, 5, 10, 20]
+COMMENT_THRESHOLDS = [5, 20, 50]
+COMMENT_POINTS = [0, 5, 10, 15]
+
+
 def score_opportunity(opp: dict) -> int:
     """Score an opportunity based on various factors"""
-    score = 0
-    
-    # More pain signals = higher score
-    score += len(opp.get("pain_signals", [])) * 10
-    
-    # Industry relevance
-    score += len(opp.get("industries", [])) * 5
-    
-    # Engagement (upvotes/score)
-    post_score = opp.get("score", 0)
-    if post_score > 100:
-        score += 20
-    elif post_score > 50:
-        score += 10
-    elif post_score > 10:
-        score += 5
-    
-    # Comments indicate discussion
-    num_comments = opp.get("num_comments", 0)
-    if num_comments > 50:
-        score += 15
-    elif num_comments > 20:
-        score += 10
-    elif num_comments > 5:
-        score += 5
-    
-    return score
+    return (
+        # More pain signals = higher score
+        len(opp.get("pain_signals", [])) * 10
+        # Industry relevance
+        + len(opp.get("industries", [])) * 5
+        # Engagement (upvotes/score)
+        + SCORE_POINTS[bisect_left(SCORE_THRESHOLDS, opp.get("score", 0))]
+        # Comments indicate discussion
+        + COMMENT_POINTS[bisect_left(COMMENT_THRESHOLDS, opp.get("num_comments", 0))]
+    )
 
 
 def save_results(opportunities: list[dict], output_dir: str = OUTPUT_DIR):
@@ -104,6 +96,14 @@ def print_summary(opportunities: list[dict]):
         print(f"  {ind}: {count} opportunities")
 
 
+async def collect_hn(opportunities: list[dict]):
+    """Scan Hacker News, appending scored opportunities as they are found"""
+    async for opp in scan_hacker_news():
+        opp["priority_score"] = score_opportunity(opp)
+        opportunities.append(opp)
+        print(f"  Found: {opp['title'][:50]}...")
+
+
 def main():
     print("=" * 70)
     print("SAAS OPPORTUNITY BOT")
@@ -114,10 +114,7 @@ def main():
     
     # Scan Hacker News
     try:
-        for opp in scan_hacker_news():
-            opp["priority_score"] = score_opportunity(opp)
-            all_opportunities.append(opp)
-            print(f"  Found: {opp['title'][:50]}...")
+        asyncio.run(collect_hn(all_opportunities))
     except KeyboardInterrupt:
         print("\nHN scan interrupted...")
     except Exception as e:
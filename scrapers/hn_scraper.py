@@ -1,160 +1,201 @@
 """Hacker News scraper using official API"""
 
-import requests
-from typing import Generator
-from config import PAIN_SIGNALS, INDUSTRIES, HN_STORIES_TO_CHECK, HN_MIN_COMMENTS
+import asyncio
+import time
+from typing import AsyncGenerator
+
+import diskcache
+import httpx
+from config import (
+    HN_STORIES_TO_CHECK, HN_MIN_COMMENTS, HN_MAX_CONCURRENCY,
+    HN_CACHE_DIR, HN_STORY_CACHE_TTL, HN_COMMENT_CACHE_TTL,
+)
+from scrapers.matcher import scan_texts, match_fields
 
 
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 
+# Shared pooled client; HN items are fetched in parallel, bounded by the semaphore
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+    timeout=10.0,
+)
+request_semaphore = asyncio.Semaphore(HN_MAX_CONCURRENCY)
+
+# Items persist across scans and restarts; see item_cache_ttl for expiry
+item_cache = diskcache.Cache(HN_CACHE_DIR)
+
+
+async def fetch_json(path: str):
+    """GET a path under the HN API and decode the JSON body"""
+    async with request_semaphore:
+        response = await http_client.get(f"{HN_API_BASE}/{path}")
+    response.raise_for_status()
+    return response.json()
 
-def get_top_stories(limit: int = HN_STORIES_TO_CHECK) -> list[int]:
+
+async def get_top_stories(limit: int = HN_STORIES_TO_CHECK) -> list[int]:
     """Get IDs of top stories"""
     try:
-        response = requests.get(f"{HN_API_BASE}/topstories.json", timeout=10)
-        response.raise_for_status()
-        return response.json()[:limit]
+        return (await fetch_json("topstories.json"))[:limit]
     except Exception as e:
         print(f"Error fetching top stories: {e}")
         return []
 
 
-def get_new_stories(limit: int = HN_STORIES_TO_CHECK) -> list[int]:
+async def get_new_stories(limit: int = HN_STORIES_TO_CHECK) -> list[int]:
     """Get IDs of new stories"""
     try:
-        response = requests.get(f"{HN_API_BASE}/newstories.json", timeout=10)
-        response.raise_for_status()
-        return response.json()[:limit]
+        return (await fetch_json("newstories.json"))[:limit]
     except Exception as e:
         print(f"Error fetching new stories: {e}")
         return []
 
 
-def get_ask_stories(limit: int = 50) -> list[int]:
+async def get_ask_stories(limit: int = 50) -> list[int]:
     """Get IDs of Ask HN stories (often contain pain points)"""
     try:
-        response = requests.get(f"{HN_API_BASE}/askstories.json", timeout=10)
-        response.raise_for_status()
-        return response.json()[:limit]
+        return (await fetch_json("askstories.json"))[:limit]
     except Exception as e:
         print(f"Error fetching ask stories: {e}")
         return []
 
 
-def get_item(item_id: int) -> dict:
-    """Get a single HN item (story or comment)"""
+def item_cache_ttl(item: dict) -> int:
+    """Seconds to cache an item: comments and day-old stories rarely change, fresh stories do"""
+    if item.get("type") == "comment" or time.time() - item.get("time", 0) > 86400:
+        return HN_COMMENT_CACHE_TTL
+    return HN_STORY_CACHE_TTL  # score and descendants are still climbing
+
+
+def read_cached_items(item_ids: list[int]) -> list:
+    """Cached items (None where missing), read in one transaction; blocking, run off the event loop"""
+    with item_cache.transact():
+        return [item_cache.get(item_id) for item_id in item_ids]
+
+
+def write_cached_items(items: list[tuple[int, dict]]):
+    """Cache fetched items in one transaction; blocking, run off the event loop"""
+    with item_cache.transact():
+        for item_id, item in items:
+            item_cache.set(item_id, item, expire=item_cache_ttl(item))
+
+
+async def fetch_item(item_id: int) -> dict:
+    """Fetch a single HN item (story or comment) from the API"""
     try:
-        response = requests.get(f"{HN_API_BASE}/item/{item_id}.json", timeout=10)
-        response.raise_for_status()
-        return response.json() or {}
+        return await fetch_json(f"item/{item_id}.json") or {}
     except Exception as e:
         print(f"Error fetching item {item_id}: {e}")
         return {}
 
 
-def get_comments(story: dict, max_depth: int = 2, current_depth: int = 0) -> list[dict]:
-    """Recursively get comments for a story"""
+async def get_items(item_ids: list[int]) -> list[dict]:
+    """Get many HN items, fetching only those not cached.
+    
+    The disk cache is SQLite, so the batch is read and written with one
+    to_thread call each instead of blocking the event loop per item.
+    """
+    items = await asyncio.to_thread(read_cached_items, item_ids)
+    missing = [i for i, item in enumerate(items) if item is None]
+    fetched = await asyncio.gather(*(fetch_item(item_ids[i]) for i in missing))
+    for i, item in zip(missing, fetched):
+        items[i] = item
+    fresh = [(item_ids[i], item) for i, item in zip(missing, fetched) if item]  # failures aren't cached
+    if fresh:
+        await asyncio.to_thread(write_cached_items, fresh)
+    return items
+
+
+async def get_comment_tree(story: dict, max_depth: int = 2) -> list[dict]:
+    """Get comments for a story breadth-first, fetching each level in one batch"""
     comments = []
-    kids = story.get("kids", [])
+    frontier = story.get("kids", [])[:20]  # Limit to first 20 comments per parent
     
-    for kid_id in kids[:20]:  # Limit to first 20 comments per level
-        comment = get_item(kid_id)
-        if comment and comment.get("type") == "comment" and not comment.get("deleted"):
-            comments.append(comment)
-            if current_depth < max_depth:
-                comments.extend(get_comments(comment, max_depth, current_depth + 1))
+    for _ in range(max_depth + 1):
+        if not frontier:
+            break
+        items = await get_items(frontier)
+        level = [c for c in items if c and c.get("type") == "comment" and not c.get("deleted")]
+        comments.extend(level)
+        frontier = [kid_id for c in level for kid_id in c.get("kids", [])[:20]]
     
     return comments
 
 
-def contains_pain_signal(text: str) -> tuple[bool, list[str]]:
-    """Check if text contains pain point signals"""
-    if not text:
-        return False, []
-    text_lower = text.lower()
-    found_signals = []
-    for signal in PAIN_SIGNALS:
-        if signal.lower() in text_lower:
-            found_signals.append(signal)
-    return len(found_signals) > 0, found_signals
-
-
-def identify_industry(text: str) -> list[str]:
-    """Identify which industries the text relates to"""
-    if not text:
-        return []
-    text_lower = text.lower()
-    found_industries = []
-    for industry, keywords in INDUSTRIES.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                found_industries.append(industry)
-                break
-    return found_industries
-
-
-def scan_hacker_news() -> Generator[dict, None, None]:
+async def scan_hacker_news() -> AsyncGenerator[dict, None]:
     """Scan Hacker News for SaaS opportunities"""
     print("Scanning Hacker News...")
     
     # Combine different story sources
-    story_ids = set()
-    story_ids.update(get_top_stories())
-    story_ids.update(get_new_stories())
-    story_ids.update(get_ask_stories())
+    id_lists = await asyncio.gather(get_top_stories(), get_new_stories(), get_ask_stories())
+    story_ids = list(set().union(*id_lists))
     
     print(f"  Checking {len(story_ids)} stories...")
     
-    for story_id in story_ids:
-        story = get_item(story_id)
-        if not story:
-            continue
-        
-        title = story.get("title", "")
-        text = story.get("text", "")  # For Ask HN posts
-        full_text = f"{title} {text}"
-        
-        has_pain, signals = contains_pain_signal(full_text)
-        industries = identify_industry(full_text)
-        
-        # Check the story itself
-        if has_pain:
-            yield {
-                "source": "hackernews",
-                "title": title,
-                "text": text[:500] if text else "",
-                "url": f"https://news.ycombinator.com/item?id={story_id}",
-                "score": story.get("score", 0),
-                "num_comments": story.get("descendants", 0),
-                "pain_signals": signals,
-                "industries": industries,
-                "type": "story",
-            }
-        
-        # Check comments if story has enough engagement
-        if story.get("descendants", 0) >= HN_MIN_COMMENTS:
-            comments = get_comments(story)
-            for comment in comments:
-                comment_text = comment.get("text", "")
-                has_pain, signals = contains_pain_signal(comment_text)
-                
-                if has_pain:
-                    yield {
-                        "source": "hackernews",
-                        "title": f"Comment on: {title[:50]}",
-                        "text": comment_text[:500] if comment_text else "",
-                        "url": f"https://news.ycombinator.com/item?id={comment.get('id')}",
-                        "score": 0,  # HN comments don't show score
-                        "pain_signals": signals,
-                        "industries": identify_industry(comment_text),
-                        "type": "comment",
-                    }
-
-
-if __name__ == "__main__":
-    for opportunity in scan_hacker_news():
+    items = await get_items(story_ids)
+    stories = [(story_id, story) for story_id, story in zip(story_ids, items) if story]
+    matches = scan_texts([f"{story.get('title', '')} {story.get('text', '')}".lower() for _, story in stories])
+    
+    # Start comment fetches for engaged stories up front so they overlap. Stories
+    # with no signal or industry only get their comments read if they carry a
+    # text body (Ask HN style), where pain points cluster
+    comment_tasks = {
+        story_id: asyncio.ensure_future(get_comment_tree(story))
+        for (story_id, story), (signal_mask, industry_mask) in zip(stories, matches)
+        if story.get("descendants", 0) >= HN_MIN_COMMENTS
+        and (signal_mask or industry_mask or (story.get("type") == "story" and story.get("text")))
+    }
+    
+    try:
+        for (story_id, story), (signal_mask, industry_mask) in zip(stories, matches):
+            title = story.get("title", "")
+            text = story.get("text", "")  # For Ask HN posts
+            
+            # Check the story itself
+            if signal_mask:
+                yield {
+                    "source": "hackernews",
+                    "title": title,
+                    "text": text[:500] if text else "",
+                    "url": f"https://news.ycombinator.com/item?id={story_id}",
+                    "score": story.get("score", 0),
+                    "num_comments": story.get("descendants", 0),
+                    **match_fields(signal_mask, industry_mask),
+                    "type": "story",
+                }
+            
+            # Check comments if story has enough engagement
+            if story_id in comment_tasks:
+                comments = await comment_tasks[story_id]
+                comment_texts = [comment.get("text") or "" for comment in comments]
+                comment_matches = scan_texts([t.lower() for t in comment_texts])
+                for comment, comment_text, (signal_mask, industry_mask) in zip(comments, comment_texts, comment_matches):
+                    if signal_mask:
+                        yield {
+                            "source": "hackernews",
+                            "title": f"Comment on: {title[:50]}",
+                            "text": comment_text[:500] if comment_text else "",
+                            "url": f"https://news.ycombinator.com/item?id={comment.get('id')}",
+                            "score": 0,  # HN comments don't show score
+                            **match_fields(signal_mask, industry_mask),
+                            "type": "comment",
+                        }
+    finally:
+        for task in comment_tasks.values():
+            task.cancel()
+
+
+async def print_scan():
+    """Print opportunities as the scan finds them"""
+    async for opportunity in scan_hacker_news():
         print(f"\n{'='*60}")
         print(f"[HN] {opportunity['title']}")
         print(f"Signals: {opportunity['pain_signals']}")
         print(f"Industries: {opportunity['industries']}")
         print(f"URL: {opportunity['url']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(print_scan())
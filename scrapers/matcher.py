@@ -0,0 +1,153 @@
+"""Single-pass matching of pain signals and industry keywords"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate
+
+from config import PAIN_SIGNALS, INDUSTRIES
+
+try:
+    import ahocorasick
+except ImportError:  # Matching falls back to a compiled regex
+    ahocorasick = None
+
+
+# Patterns are lowercased once here; callers lowercase each text once
+PAIN_SIGNALS_LOWER = [s.lower() for s in PAIN_SIGNALS]
+INDUSTRY_NAMES = list(INDUSTRIES)
+
+# Matched sets are bitmaps: bit i of a signal mask is PAIN_SIGNALS[i], bit i
+# of an industry mask is INDUSTRY_NAMES[i]
+INDUSTRY_BIT = {industry: 1 << i for i, industry in enumerate(INDUSTRY_NAMES)}
+
+
+# Keywords that are mass nouns or adjectives and so take no plural
+UNCOUNTABLE = {
+    "healthcare", "telehealth", "compliance", "legal tech", "real estate", "ecommerce", "shopify",
+    "fulfillment", "client work", "software development", "medical", "financial",
+}
+
+# Derived words a keyword's substring match used to catch that whole-word
+# matching would otherwise lose
+DERIVED_FORMS = {
+    "engineer": ["engineering"],
+    "founder": ["cofounder", "cofounders"],
+    "broker": ["brokerage", "brokerages"],
+    "clinic": ["clinical"],
+    "tax": ["taxation"],
+}
+
+
+def plural(keyword: str) -> str | None:
+    """English plural of a config keyword (as written in config), or None if it has none"""
+    if not keyword.islower():
+        # Short all-caps acronyms (CFO, API) take a plain "s"; SaaS, B2B, HIPAA take none
+        return f"{keyword}s".lower() if keyword.isalpha() and keyword.isupper() and len(keyword) <= 3 else None
+    if keyword in UNCOUNTABLE or keyword.endswith(("ing", "s")):
+        return None
+    if keyword.endswith(("x", "z", "ch", "sh")) and not keyword.endswith("tech"):  # "tech" ends in a k sound
+        return f"{keyword}es"
+    if keyword.endswith("y") and keyword[-2] not in "aeiou":
+        return f"{keyword[:-1]}ies"
+    return f"{keyword}s"
+
+
+def word_forms(keyword: str) -> list[str]:
+    """The lowercased keyword plus its plural and derived words, for whole-word matching"""
+    lowered = keyword.lower()
+    forms = [lowered, *DERIVED_FORMS.get(lowered, [])]
+    if (plural_form := plural(keyword)):
+        forms.append(plural_form)
+    return forms
+
+
+# What each pattern sets: (slot, bit, word_length). Slot 0 is a signal bit,
+# slot 1 an industry bit, indexing a [signal_mask, industry_mask] pair.
+# Pain signals always match as substrings (word_length 0). Industry keywords
+# have two pattern sets: substring matching of the keywords as configured
+# (what HN uses), and whole-word matching of each keyword's forms, where
+# word_length is the pattern length (what Reddit uses, so "tax" doesn't fire
+# inside "syntax")
+SIGNAL_PAYLOADS = {signal: (0, 1 << i, 0) for i, signal in enumerate(PAIN_SIGNALS_LOWER)}
+SUBSTRING_PAYLOADS = dict(SIGNAL_PAYLOADS)
+WORD_PAYLOADS = dict(SIGNAL_PAYLOADS)
+for i, keywords in enumerate(INDUSTRIES.values()):
+    SUBSTRING_PAYLOADS.update({keyword.lower(): (1, 1 << i, 0) for keyword in keywords})
+    WORD_PAYLOADS.update({
+        form: (1, 1 << i, len(form)) for keyword in keywords for form in word_forms(keyword)
+    })
+
+
+def is_word_char(char: str) -> bool:
+    """Same notion of a word character as regex \\w"""
+    return char.isalnum() or char == "_"
+
+
+def is_whole_word(text: str, end: int, length: int) -> bool:
+    """True if the match of the given length ending at index end isn't part of a longer word"""
+    start = end - length + 1
+    return (start == 0 or not is_word_char(text[start - 1])) and (
+        end + 1 == len(text) or not is_word_char(text[end + 1])
+    )
+
+
+def build_matcher(payloads: dict):
+    """Compile every pattern into one matcher (Aho-Corasick if available, else one regex)"""
+    if ahocorasick:
+        automaton = ahocorasick.Automaton()
+        for pattern, payload in payloads.items():
+            automaton.add_word(pattern, payload)
+        automaton.make_automaton()
+        return automaton
+    # Longest-first alternation inside a lookahead so overlapping hits are all reported
+    alternation = "|".join(re.escape(p) for p in sorted(payloads, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+SUBSTRING_MATCHER = build_matcher(SUBSTRING_PAYLOADS)
+WORD_MATCHER = build_matcher(WORD_PAYLOADS)
+
+
+def iter_matches(text_lower: str, matcher, payloads: dict):
+    """Yield (end, payload) for every pattern occurrence in the text; end is the match's last character"""
+    if ahocorasick:
+        yield from matcher.iter(text_lower)
+    else:
+        for match in matcher.finditer(text_lower):
+            yield match.end(1) - 1, payloads[match.group(1)]
+
+
+def mask_names(mask: int, names: list[str]) -> list[str]:
+    """Expand a bitmap into the names whose bits are set, in config order"""
+    return [name for i, name in enumerate(names) if mask >> i & 1]
+
+
+def scan_texts(texts_lower: list[str], whole_words: bool = False) -> list[tuple[int, int]]:
+    """Match many lowercased texts in one matcher pass; returns (signal_mask, industry_mask) per text.
+    
+    Industry keywords match as substrings unless whole_words is set.
+    """
+    if whole_words:
+        matcher, payloads = WORD_MATCHER, WORD_PAYLOADS
+    else:
+        matcher, payloads = SUBSTRING_MATCHER, SUBSTRING_PAYLOADS
+    # Texts are NUL-joined so no pattern can match across a boundary; the
+    # start offsets map each hit back to the text it came from
+    starts = list(accumulate((len(t) + 1 for t in texts_lower[:-1]), initial=0))
+    masks = [[0, 0] for _ in texts_lower]
+    buffer = "\0".join(texts_lower)
+    for end, (slot, bit, word_length) in iter_matches(buffer, matcher, payloads):
+        if word_length and not is_whole_word(buffer, end, word_length):
+            continue
+        masks[bisect_right(starts, end) - 1][slot] |= bit
+    return [(signal_mask, industry_mask) for signal_mask, industry_mask in masks]
+
+
+def match_fields(signal_mask: int, industry_mask: int) -> dict:
+    """Opportunity fields for a match: the bitmaps plus their names for display"""
+    return {
+        "pain_signals": mask_names(signal_mask, PAIN_SIGNALS),
+        "industries": mask_names(industry_mask, INDUSTRY_NAMES),
+        "signal_mask": signal_mask,
+        "industry_mask": industry_mask,
+    }
@@ -1,47 +1,129 @@
 """Reddit scraper using public JSON API (no auth required)"""
 
-import requests
-import time
-from typing import Generator
-from config import SUBREDDITS, PAIN_SIGNALS, INDUSTRIES
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import AsyncGenerator
 
+import diskcache
+import httpx
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache
+from config import (
+    SUBREDDITS, PAIN_SIGNALS, REDDIT_MAX_CONCURRENCY, REDDIT_REQUESTS_PER_MINUTE, REDDIT_MAX_COMMENT_HITS,
+    REDDIT_CACHE_DIR, REDDIT_CACHE_TTL, REDDIT_MIN_COMMENTS, REDDIT_MIN_POST_SCORE, REDDIT_MAX_COMMENT_FETCHES_PER_SUB,
+)
+from scrapers.matcher import mask_names, scan_texts, INDUSTRY_NAMES
 
-def get_subreddit_posts(subreddit: str, limit: int = 50) -> list[dict]:
+
+REDDIT_BASE = "https://www.reddit.com"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+# Shared pooled client; listings and comment threads are fetched in parallel,
+# bounded by the semaphore. The pool is sized to match so every request in
+# flight keeps a warm connection and none queue inside httpx
+http_client = httpx.AsyncClient(
+    headers={"User-Agent": "SaaSOpportunityBot/1.0", "Accept-Encoding": "gzip, br"},
+    limits=httpx.Limits(max_connections=REDDIT_MAX_CONCURRENCY, max_keepalive_connections=REDDIT_MAX_CONCURRENCY),
+    timeout=10.0,
+)
+request_semaphore = asyncio.Semaphore(REDDIT_MAX_CONCURRENCY)
+# Token bucket under Reddit's 60 req/min budget; requests only wait once it is spent
+rate_limiter = AsyncLimiter(REDDIT_REQUESTS_PER_MINUTE, 60)
+
+# Listings and matched comments persist across scans and restarts, so reruns
+# within the TTL cost no requests or rate-limit budget. It is SQLite-backed, so
+# reads and writes run off the event loop
+response_cache = diskcache.Cache(REDDIT_CACHE_DIR)
+
+# Match masks of recently seen texts; boilerplate, bot replies and quoted
+# text repeat across threads. Long texts rarely repeat and are not kept
+mask_cache = LRUCache(maxsize=8192)
+MAX_CACHED_TEXT = 4096
+
+
+@asynccontextmanager
+async def open_response(path: str):
+    """Stream a GET on reddit.com, holding a request slot until the body is consumed; retries throttled and 5xx responses"""
+    for attempt in range(MAX_RETRIES + 1):
+        async with request_semaphore, rate_limiter:
+            async with http_client.stream("GET", f"{REDDIT_BASE}{path}") as response:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    yield response
+                    return
+        await asyncio.sleep(0.5 * 2 ** attempt)
+
+
+async def fetch_json(path: str):
+    """GET a path on reddit.com and decode the JSON body"""
+    async with open_response(path) as response:
+        return orjson.loads(await response.aread())
+
+
+async def get_subreddit_posts(subreddit: str, limit: int = 50) -> list[dict]:
     """Fetch recent posts from a subreddit using public JSON API"""
-    url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}"
-    headers = {"User-Agent": "SaaSOpportunityBot/1.0"}
-    
+    key = f"posts:{subreddit}:{limit}"
+    posts = await asyncio.to_thread(response_cache.get, key)
+    if posts is not None:
+        return posts
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {}).get("children", [])
+        data = await fetch_json(f"/r/{subreddit}/hot.json?limit={limit}&raw_json=1")
     except Exception as e:
         print(f"Error fetching r/{subreddit}: {e}")
         return []
+    posts = data.get("data", {}).get("children", [])
+    await asyncio.to_thread(response_cache.set, key, posts, expire=REDDIT_CACHE_TTL)
+    return posts
 
 
-def get_post_comments(permalink: str, limit: int = 100) -> list[dict]:
-    """Fetch comments for a specific post"""
-    url = f"https://www.reddit.com{permalink}.json?limit={limit}"
-    headers = {"User-Agent": "SaaSOpportunityBot/1.0"}
-    
+async def stream_comment_hits(permalink: str, limit: int) -> list[tuple[dict, tuple[int, int]]]:
+    """Stream a post's comments, returning (comment, match masks) for those with a pain signal and score >= 3"""
+    hits = []
+    # Each top-level comment (with its replies) is parsed and matched as it
+    # arrives, so the whole thread is never held in memory; once enough hits
+    # are found the rest of the body is not read
+    children = ijson.sendable_list()
+    parser = ijson.items_coro(children, "item.data.children.item", use_float=True)
+    async with open_response(f"{permalink}.json?limit={limit}&raw_json=1") as response:
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            # Low-score comments are dropped before any text is lowercased or scanned
+            comments = [c for c in extract_comments(children) if c.get("score", 0) >= 3]
+            del children[:]
+            comment_matches = scan_cached([comment.get("body", "") for comment in comments])
+            hits.extend((c, masks) for c, masks in zip(comments, comment_matches) if masks[0])
+            if len(hits) >= REDDIT_MAX_COMMENT_HITS:
+                return hits[:REDDIT_MAX_COMMENT_HITS]
+    parser.close()
+    return hits
+
+
+async def get_comment_hits(permalink: str, limit: int = 100) -> list[tuple[dict, tuple[int, int]]]:
+    """Matching comments for a post, from the response cache when fresh"""
+    key = f"comments:{permalink}:{limit}"
+    hits = await asyncio.to_thread(response_cache.get, key)
+    if hits is not None:
+        return hits
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        if len(data) > 1:
-            return extract_comments(data[1].get("data", {}).get("children", []))
-        return []
+        hits = await stream_comment_hits(permalink, limit)
     except Exception as e:
         print(f"Error fetching comments: {e}")
         return []
+    await asyncio.to_thread(response_cache.set, key, hits, expire=REDDIT_CACHE_TTL)
+    return hits
 
 
-def extract_comments(children: list, depth: int = 0) -> list[dict]:
-    """Recursively extract comments from nested structure"""
+def extract_comments(children: list) -> list[dict]:
+    """Flatten the nested comment structure, in thread order"""
     comments = []
-    for child in children:
+    stack = children[::-1]  # Reversed so pops come off in thread order
+    while stack:
+        child = stack.pop()
         if child.get("kind") == "t1":
             data = child.get("data", {})
             comments.append({
@@ -49,95 +131,150 @@ def extract_comments(children: list, depth: int = 0) -> list[dict]:
                 "score": data.get("score", 0),
                 "author": data.get("author", ""),
             })
-            # Get replies
+            # Replies are visited next, before the comment's later siblings
             replies = data.get("replies")
             if isinstance(replies, dict):
-                reply_children = replies.get("data", {}).get("children", [])
-                comments.extend(extract_comments(reply_children, depth + 1))
+                stack.extend(reversed(replies.get("data", {}).get("children", [])))
     return comments
 
 
-def contains_pain_signal(text: str) -> tuple[bool, list[str]]:
-    """Check if text contains pain point signals"""
-    text_lower = text.lower()
-    found_signals = []
-    for signal in PAIN_SIGNALS:
-        if signal.lower() in text_lower:
-            found_signals.append(signal)
-    return len(found_signals) > 0, found_signals
+def scan_cached(texts: list[str]) -> list[tuple[int, int]]:
+    """scan_texts over raw texts, lowercasing and scanning only those not seen recently"""
+    hits = {text: mask_cache[text] for text in texts if text in mask_cache}
+    misses = [text for text in dict.fromkeys(texts) if text not in hits]
+    found = dict(zip(misses, scan_texts([text.lower() for text in misses], whole_words=True)))
+    for text, masks in found.items():
+        if len(text) <= MAX_CACHED_TEXT:
+            mask_cache[text] = masks
+    found.update(hits)
+    return [found[text] for text in texts]
+
+
+@dataclass(slots=True)
+class Opportunity:
+    """A Reddit post or comment carrying a pain signal"""
+    source: str
+    subreddit: str
+    title: str
+    text: str
+    url: str
+    score: int
+    signal_mask: int
+    industry_mask: int
+    type: str
+    num_comments: int = 0
+
+    @property
+    def pain_signals(self) -> list[str]:
+        return mask_names(self.signal_mask, PAIN_SIGNALS)
 
+    @property
+    def industries(self) -> list[str]:
+        return mask_names(self.industry_mask, INDUSTRY_NAMES)
 
-def identify_industry(text: str) -> list[str]:
-    """Identify which industries the text relates to"""
-    text_lower = text.lower()
-    found_industries = []
-    for industry, keywords in INDUSTRIES.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                found_industries.append(industry)
-                break
-    return found_industries
+    def as_dict(self) -> dict:
+        """Plain dict in the shape the HN scraper yields, for scoring and JSON output"""
+        return {
+            "source": self.source,
+            "subreddit": self.subreddit,
+            "title": self.title,
+            "text": self.text,
+            "url": self.url,
+            "score": self.score,
+            "num_comments": self.num_comments,
+            "pain_signals": self.pain_signals,
+            "industries": self.industries,
+            "signal_mask": self.signal_mask,
+            "industry_mask": self.industry_mask,
+            "type": self.type,
+        }
 
 
-def scan_reddit() -> Generator[dict, None, None]:
+async def get_listing(subreddit: str) -> tuple[str, list[dict]]:
+    """Fetch a subreddit's posts, tagged with the subreddit so listings can complete in any order"""
+    return subreddit, await get_subreddit_posts(subreddit)
+
+
+async def scan_reddit() -> AsyncGenerator[Opportunity, None]:
     """Scan Reddit for SaaS opportunities"""
     print("Scanning Reddit...")
     
-    for subreddit in SUBREDDITS:
-        print(f"  Checking r/{subreddit}...")
-        posts = get_subreddit_posts(subreddit)
-        
-        for post in posts:
-            data = post.get("data", {})
-            title = data.get("title", "")
-            selftext = data.get("selftext", "")
-            permalink = data.get("permalink", "")
-            full_text = f"{title} {selftext}"
-            
-            has_pain, signals = contains_pain_signal(full_text)
-            industries = identify_industry(full_text)
+    # All listings fetch at once; each subreddit is scanned as soon as its listing lands
+    listing_tasks = [asyncio.ensure_future(get_listing(subreddit)) for subreddit in SUBREDDITS]
+    comment_tasks = {}
+    
+    try:
+        for next_listing in asyncio.as_completed(listing_tasks):
+            subreddit, posts = await next_listing
+            print(f"  Checking r/{subreddit}...")
+            posts = [post.get("data", {}) for post in posts]
             
-            if has_pain:
-                yield {
-                    "source": "reddit",
-                    "subreddit": subreddit,
-                    "title": title,
-                    "text": selftext[:500] if selftext else "",
-                    "url": f"https://reddit.com{permalink}",
-                    "score": data.get("score", 0),
-                    "num_comments": data.get("num_comments", 0),
-                    "pain_signals": signals,
-                    "industries": industries,
-                    "type": "post",
-                }
+            # Start this subreddit's comment fetches up front so they overlap. Only
+            # discussed, upvoted posts qualify, and a per-subreddit budget (taken
+            # in hot order) keeps one noisy subreddit from spending the rate limit
+            engaged = (
+                data.get("permalink", "") for data in posts
+                if data.get("num_comments", 0) > REDDIT_MIN_COMMENTS
+                and data.get("score", 0) >= REDDIT_MIN_POST_SCORE
+            )
+            comment_tasks = {
+                permalink: asyncio.ensure_future(get_comment_hits(permalink))
+                for permalink in islice(engaged, REDDIT_MAX_COMMENT_FETCHES_PER_SUB)
+            }
             
-            # Check comments for pain signals
-            if data.get("num_comments", 0) > 5:
-                comments = get_post_comments(permalink)
-                for comment in comments:
-                    body = comment.get("body", "")
-                    has_pain, signals = contains_pain_signal(body)
-                    if has_pain and comment.get("score", 0) >= 3:
-                        yield {
-                            "source": "reddit",
-                            "subreddit": subreddit,
-                            "title": f"Comment on: {title[:50]}",
-                            "text": body[:500],
-                            "url": f"https://reddit.com{permalink}",
-                            "score": comment.get("score", 0),
-                            "pain_signals": signals,
-                            "industries": identify_industry(body),
-                            "type": "comment",
-                        }
-                time.sleep(1)  # Rate limiting
-        
-        time.sleep(2)  # Rate limiting between subreddits
+            for data in posts:
+                title = data.get("title", "")
+                selftext = data.get("selftext", "")
+                permalink = data.get("permalink", "")
+                
+                # Title and body are matched as separate texts rather than
+                # joined into one copy; hits from either count
+                (title_signals, title_industries), (text_signals, text_industries) = scan_cached([title, selftext])
+                signal_mask = title_signals | text_signals
+                industry_mask = title_industries | text_industries
+                
+                if signal_mask:
+                    yield Opportunity(
+                        source="reddit",
+                        subreddit=subreddit,
+                        title=title,
+                        text=selftext[:500] if selftext else "",
+                        url=f"https://reddit.com{permalink}",
+                        score=data.get("score", 0),
+                        num_comments=data.get("num_comments", 0),
+                        signal_mask=signal_mask,
+                        industry_mask=industry_mask,
+                        type="post",
+                    )
+                
+                # Check comments for pain signals
+                if permalink in comment_tasks:
+                    for comment, (signal_mask, industry_mask) in await comment_tasks[permalink]:
+                        yield Opportunity(
+                            source="reddit",
+                            subreddit=subreddit,
+                            title=f"Comment on: {title[:50]}",
+                            text=comment.get("body", "")[:500],
+                            url=f"https://reddit.com{permalink}",
+                            score=comment.get("score", 0),
+                            signal_mask=signal_mask,
+                            industry_mask=industry_mask,
+                            type="comment",
+                        )
+    finally:
+        for task in [*listing_tasks, *comment_tasks.values()]:
+            task.cancel()
 
 
-if __name__ == "__main__":
-    for opportunity in scan_reddit():
+async def print_scan():
+    """Print opportunities as the scan finds them"""
+    async for opportunity in scan_reddit():
         print(f"\n{'='*60}")
-        print(f"[{opportunity['subreddit']}] {opportunity['title']}")
-        print(f"Signals: {opportunity['pain_signals']}")
-        print(f"Industries: {opportunity['industries']}")
-        print(f"URL: {opportunity['url']}")
+        print(f"[{opportunity.subreddit}] {opportunity.title}")
+        print(f"Signals: {opportunity.pain_signals}")
+        print(f"Industries: {opportunity.industries}")
+        print(f"URL: {opportunity.url}")
+
+
+if __name__ == "__main__":
+    asyncio.run(print_scan())